@@ -6,15 +6,14 @@ A standalone GUI application to create and print ArUco markers.
 
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
-import cv2
-import numpy as np
-from PIL import Image, ImageTk, ImageDraw, ImageFont
 import os
+import subprocess
 import sys
 import tempfile
+from concurrent.futures import ThreadPoolExecutor
 
-# Import the core functions from generate_aruco
-from generate_aruco import generate_aruco_marker, generate_print_layout
+# cv2, NumPy, PIL and generate_aruco are imported on first use so the
+# window appears without waiting for OpenCV to load
 
 
 class ArucoMarkerUI:
@@ -28,6 +27,30 @@ class ArucoMarkerUI:
         self.current_marker = None
         self.current_image = None
         
+        # Grayscale uint8 pixel data of the current marker, used as the
+        # source for the preview
+        self.current_marker_np = None
+        
+        # Source image and size the cached preview was rendered from
+        self._preview_source = None
+        self._preview_size = None
+        
+        # Resized preview pixels, reused while the preview shape is unchanged
+        self._preview_buf = None
+        
+        # Settings the current marker was generated with
+        self._last_gen_key = None
+        
+        # Temporary print file and the settings of the marker written to it
+        self._last_saved_path = None
+        self._last_saved_key = None
+        
+        # Single background worker so generation doesn't block the Tk main loop
+        self._executor = ThreadPoolExecutor(max_workers=1)
+        
+        # Pending after() callback for redrawing the preview on canvas resize
+        self._resize_after_id = None
+        
         # Dictionary max IDs for validation
         self.dict_max_ids = {
             'DICT_4X4_50': 49, 'DICT_4X4_100': 99, 'DICT_4X4_250': 249, 'DICT_4X4_1000': 999,
@@ -119,9 +142,9 @@ class ArucoMarkerUI:
         button_frame = ttk.Frame(main_frame)
         button_frame.grid(row=3, column=0, columnspan=3, pady=10)
         
-        generate_btn = ttk.Button(button_frame, text="Generate Marker", 
-                                 command=self.generate_marker)
-        generate_btn.grid(row=0, column=0, padx=5)
+        self.generate_btn = ttk.Button(button_frame, text="Generate Marker", 
+                                      command=self.generate_marker)
+        self.generate_btn.grid(row=0, column=0, padx=5)
         
         save_btn = ttk.Button(button_frame, text="Save As...", 
                             command=self.save_marker)
@@ -139,6 +162,7 @@ class ArucoMarkerUI:
         # Canvas for displaying the marker
         self.canvas = tk.Canvas(preview_frame, bg='white', width=500, height=500)
         self.canvas.pack(fill=tk.BOTH, expand=True)
+        self.canvas.bind('<Configure>', self.on_canvas_resize)
         
         # Status bar
         self.status_var = tk.StringVar(value="Ready. Click 'Generate Marker' to create an ArUco marker.")
@@ -175,6 +199,18 @@ class ArucoMarkerUI:
             self.count_spin.config(state='normal')
             self.count_var.set(9)
     
+    def on_canvas_resize(self, event=None):
+        """Redraw the preview once the canvas has stopped resizing"""
+        # Tk fires <Configure> continuously while the window is dragged, so
+        # only redraw after 50 ms without a further resize
+        if self._resize_after_id is not None:
+            self.root.after_cancel(self._resize_after_id)
+        self._resize_after_id = self.root.after(50, self._redraw_after_resize)
+    
+    def _redraw_after_resize(self):
+        self._resize_after_id = None
+        self.display_marker()
+    
     def generate_marker(self):
         """Generate the ArUco marker based on current settings"""
         try:
@@ -182,48 +218,83 @@ class ArucoMarkerUI:
             dictionary = self.dict_var.get()
             size = self.size_var.get()
             layout_type = self.layout_var.get()
-            
-            if layout_type == 'single':
-                # Generate single marker
-                marker_img = generate_aruco_marker(marker_id, dictionary, size, None)
-                # Convert from grayscale to RGB for PIL
-                if len(marker_img.shape) == 2:
-                    marker_img_rgb = cv2.cvtColor(marker_img, cv2.COLOR_GRAY2RGB)
-                else:
-                    marker_img_rgb = marker_img
-                self.current_marker = Image.fromarray(marker_img_rgb)
-                self.status_var.set(f"Generated marker ID {marker_id} ({dictionary})")
-                
-            else:
-                # Generate print layout
-                count = self.count_var.get()
-                marker_ids = list(range(marker_id, marker_id + count))
-                dpi = self.dpi_var.get()
-                
-                # Create temporary file for the layout using cross-platform temp directory
-                temp_path = os.path.join(tempfile.gettempdir(), 'temp_aruco_layout.png')
-                self.current_marker = generate_print_layout(
-                    marker_ids=marker_ids,
-                    dictionary_name=dictionary,
-                    format_type=layout_type,
-                    output_path=temp_path,
-                    dpi=dpi,
-                    margin_mm=10
-                )
-                self.status_var.set(f"Generated {layout_type.upper()} layout with {count} marker(s)")
-            
-            # Display the marker
+            count = self.count_var.get()
+            dpi = self.dpi_var.get()
+        except Exception as e:
+            messagebox.showerror("Error", f"Failed to generate marker: {str(e)}")
+            self.status_var.set(f"Error: {str(e)}")
+            return
+        
+        # Nothing to regenerate if the settings are unchanged
+        key = (marker_id, dictionary, size, layout_type, count, dpi)
+        if key == self._last_gen_key and self.current_marker is not None:
             self.display_marker()
-            
+            return
+        
+        # Run the generation on the worker thread and hand the result back
+        # to the Tk main loop once it is done
+        self.generate_btn.config(state='disabled')
+        self.status_var.set("Generating...")
+        future = self._executor.submit(self._build_marker, *key)
+        future.add_done_callback(
+            lambda f: self.root.after(0, self._on_marker_ready, f, key))
+    
+    def _build_marker(self, marker_id, dictionary, size, layout_type, count, dpi):
+        """Build the marker image off the Tk main thread"""
+        import numpy as np
+        from PIL import Image
+        
+        # Import the core functions from generate_aruco
+        from generate_aruco import generate_aruco_marker, generate_print_layout
+        
+        if layout_type == 'single':
+            # Generate single marker
+            marker_img = generate_aruco_marker(marker_id, dictionary, size, None)
+            # Keep the marker as a single-channel 'L' image
+            marker = Image.fromarray(marker_img)
+            status = f"Generated marker ID {marker_id} ({dictionary})"
+            return marker, marker_img, status
+        
+        # Generate print layout
+        marker_ids = list(range(marker_id, marker_id + count))
+        
+        # Keep the layout in memory; it is only written out on save/print
+        layout = generate_print_layout(
+            marker_ids=marker_ids,
+            dictionary_name=dictionary,
+            format_type=layout_type,
+            output_path=None,
+            dpi=dpi,
+            margin_mm=10
+        )
+        status = f"Generated {layout_type.upper()} layout with {count} marker(s)"
+        return layout, np.asarray(layout), status
+    
+    def _on_marker_ready(self, future, key):
+        """Show a marker built by the worker thread (runs on the Tk main loop)"""
+        self.generate_btn.config(state='normal')
+        try:
+            self.current_marker, self.current_marker_np, status = future.result()
         except Exception as e:
             messagebox.showerror("Error", f"Failed to generate marker: {str(e)}")
             self.status_var.set(f"Error: {str(e)}")
+            return
+        
+        self._last_gen_key = key
+        self.status_var.set(status)
+        
+        # Display the marker
+        self.display_marker()
     
     def display_marker(self):
         """Display the generated marker on the canvas"""
-        if self.current_marker is None:
+        if self.current_marker_np is None:
             return
         
+        import cv2
+        import numpy as np
+        from PIL import Image, ImageTk
+        
         # Get canvas size
         canvas_width = self.canvas.winfo_width()
         canvas_height = self.canvas.winfo_height()
@@ -235,7 +306,7 @@ class ArucoMarkerUI:
             canvas_height = 500
         
         # Calculate scaling to fit in canvas while maintaining aspect ratio
-        marker_width, marker_height = self.current_marker.size
+        marker_height, marker_width = self.current_marker_np.shape[:2]
         scale_w = (canvas_width - 20) / marker_width
         scale_h = (canvas_height - 20) / marker_height
         scale = min(scale_w, scale_h, 1.0)  # Don't scale up, only down
@@ -243,11 +314,29 @@ class ArucoMarkerUI:
         new_width = int(marker_width * scale)
         new_height = int(marker_height * scale)
         
-        # Resize the marker for display
-        display_marker = self.current_marker.resize((new_width, new_height), Image.LANCZOS)
+        # Nothing sensible to show in a canvas this small
+        if new_width < 1 or new_height < 1:
+            return
         
-        # Convert to PhotoImage
-        self.current_image = ImageTk.PhotoImage(display_marker)
+        # Resize the marker for display, reusing the previous preview when
+        # neither the image nor the target size has changed. Markers are
+        # binary, so nearest-neighbour gives a clean preview cheaply.
+        if (self._preview_source is not self.current_marker_np
+                or self._preview_size != (new_width, new_height)):
+            # Resize into the existing preview buffer when the shape matches
+            preview_shape = (new_height, new_width) + self.current_marker_np.shape[2:]
+            if self._preview_buf is None or self._preview_buf.shape != preview_shape:
+                self._preview_buf = np.empty(preview_shape, dtype=np.uint8)
+            preview = cv2.resize(self.current_marker_np, (new_width, new_height),
+                                 dst=self._preview_buf, interpolation=cv2.INTER_NEAREST)
+            
+            # Tk's photo block transfer accepts 1-byte grayscale pixels as
+            # well as RGB, so hand the preview over without expanding it;
+            # RGB would be stored (and copied) at 4 bytes per pixel by PIL
+            display_marker = Image.fromarray(preview)
+            self.current_image = ImageTk.PhotoImage(display_marker)
+            self._preview_source = self.current_marker_np
+            self._preview_size = (new_width, new_height)
         
         # Clear canvas and display image
         self.canvas.delete("all")
@@ -279,7 +368,9 @@ class ArucoMarkerUI:
         
         if file_path:
             try:
-                self.current_marker.save(file_path)
+                # Markers are flat black/white regions, so fast low-level
+                # compression costs almost nothing in file size
+                self.current_marker.save(file_path, optimize=False, compress_level=1)
                 self.status_var.set(f"Saved to {file_path}")
                 messagebox.showinfo("Success", f"Marker saved to:\n{file_path}")
             except Exception as e:
@@ -292,17 +383,23 @@ class ArucoMarkerUI:
             return
         
         try:
-            # Save to temporary file using cross-platform temp directory
+            # Save to temporary file using cross-platform temp directory,
+            # unless this marker was already written there for a previous print
             temp_path = os.path.join(tempfile.gettempdir(), 'aruco_print_temp.png')
-            self.current_marker.save(temp_path)
+            if (self._last_saved_key != self._last_gen_key
+                    or self._last_saved_path != temp_path
+                    or not os.path.exists(temp_path)):
+                self.current_marker.save(temp_path, optimize=False, compress_level=1)
+                self._last_saved_path = temp_path
+                self._last_saved_key = self._last_gen_key
             
             # Try to open with default image viewer which usually has print option
             if sys.platform == 'win32':
                 os.startfile(temp_path)
             elif sys.platform == 'darwin':  # macOS
-                os.system(f'open "{temp_path}"')
+                subprocess.Popen(['open', temp_path], start_new_session=True)
             else:  # Linux
-                os.system(f'xdg-open "{temp_path}"')
+                subprocess.Popen(['xdg-open', temp_path], start_new_session=True)
             
             self.status_var.set("Opened marker in default viewer. Use the viewer's print function.")
             messagebox.showinfo("Print", 
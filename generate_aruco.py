@@ -10,8 +10,92 @@ pose estimation, and augmented reality.
 import cv2
 import numpy as np
 import argparse
+import functools
 import os
-from PIL import Image, ImageDraw, ImageFont
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+
+
+# Map dictionary names to OpenCV constants and their max IDs
+ARUCO_DICT_MAP = {
+    'DICT_4X4_50': (cv2.aruco.DICT_4X4_50, 49),
+    'DICT_4X4_100': (cv2.aruco.DICT_4X4_100, 99),
+    'DICT_4X4_250': (cv2.aruco.DICT_4X4_250, 249),
+    'DICT_4X4_1000': (cv2.aruco.DICT_4X4_1000, 999),
+    'DICT_5X5_50': (cv2.aruco.DICT_5X5_50, 49),
+    'DICT_5X5_100': (cv2.aruco.DICT_5X5_100, 99),
+    'DICT_5X5_250': (cv2.aruco.DICT_5X5_250, 249),
+    'DICT_5X5_1000': (cv2.aruco.DICT_5X5_1000, 999),
+    'DICT_6X6_50': (cv2.aruco.DICT_6X6_50, 49),
+    'DICT_6X6_100': (cv2.aruco.DICT_6X6_100, 99),
+    'DICT_6X6_250': (cv2.aruco.DICT_6X6_250, 249),
+    'DICT_6X6_1000': (cv2.aruco.DICT_6X6_1000, 999),
+    'DICT_7X7_50': (cv2.aruco.DICT_7X7_50, 49),
+    'DICT_7X7_100': (cv2.aruco.DICT_7X7_100, 99),
+    'DICT_7X7_250': (cv2.aruco.DICT_7X7_250, 249),
+    'DICT_7X7_1000': (cv2.aruco.DICT_7X7_1000, 999),
+}
+
+# Supported dictionary names, in display order
+DICT_NAMES = tuple(ARUCO_DICT_MAP)
+
+# PNG settings for marker files. Markers are pure black/white, so they are
+# written as 1-bit images with fast run-length compression.
+_PNG_PARAMS = [
+    cv2.IMWRITE_PNG_COMPRESSION, 1,
+    cv2.IMWRITE_PNG_STRATEGY, cv2.IMWRITE_PNG_STRATEGY_RLE,
+    cv2.IMWRITE_PNG_BILEVEL, 1,
+]
+
+
+@functools.lru_cache(maxsize=None)
+def _get_dict(dictionary_name):
+    """Return the predefined ArUco dictionary for a name, building it only once."""
+    return cv2.aruco.getPredefinedDictionary(ARUCO_DICT_MAP[dictionary_name][0])
+
+
+def _render_marker(aruco_dict, marker_id, size):
+    """Render a marker at ``size`` pixels from its natural-size bit grid."""
+    # The bit grid is the marker bits plus a one-bit border
+    grid_size = aruco_dict.markerSize + 2
+    if size < grid_size:
+        # Too small to hold the grid; let OpenCV report the error
+        return cv2.aruco.generateImageMarker(aruco_dict, marker_id, size)
+    
+    bits = cv2.aruco.generateImageMarker(aruco_dict, marker_id, grid_size)
+    
+    # Whole-multiple sizes are a pure repeat of each bit; anything else needs
+    # a nearest-neighbour resize, the only correct interpolation for markers
+    if size % grid_size == 0:
+        scale = size // grid_size
+        return bits.repeat(scale, axis=0).repeat(scale, axis=1)
+    return cv2.resize(bits, (size, size), interpolation=cv2.INTER_NEAREST)
+
+
+def _validate_marker_ids(marker_ids, dictionary_name):
+    """Raise ValueError for an unknown dictionary or any out-of-range marker ID."""
+    if dictionary_name not in ARUCO_DICT_MAP:
+        raise ValueError(f"Invalid dictionary name. Choose from: {list(ARUCO_DICT_MAP.keys())}")
+    
+    max_id = ARUCO_DICT_MAP[dictionary_name][1]
+    
+    # Validate marker IDs are within valid range for the dictionary
+    for marker_id in marker_ids:
+        if marker_id < 0 or marker_id > max_id:
+            raise ValueError(f"Marker ID {marker_id} is out of range for {dictionary_name}. Valid range: 0-{max_id}")
+
+
+def _write_marker(output_path, marker_image):
+    """Write a marker image to disk, using the fast PNG settings for .png files."""
+    ext = os.path.splitext(output_path)[1].lower()
+    params = _PNG_PARAMS if ext == '.png' else []
+    
+    # Encode in memory and write the file with a single call
+    ok, buf = cv2.imencode(ext, marker_image, params)
+    if not ok:
+        raise ValueError(f"Could not encode marker image as '{ext}' for {output_path}")
+    with open(output_path, 'wb') as f:
+        f.write(buf)
 
 
 def generate_aruco_marker(marker_id, dictionary_name='DICT_4X4_50', size=200, output_path=None):
@@ -27,51 +111,24 @@ def generate_aruco_marker(marker_id, dictionary_name='DICT_4X4_50', size=200, ou
     Returns:
         numpy.ndarray: The generated marker image
     """
-    # Map dictionary names to OpenCV constants and their max IDs
-    aruco_dict_map = {
-        'DICT_4X4_50': (cv2.aruco.DICT_4X4_50, 49),
-        'DICT_4X4_100': (cv2.aruco.DICT_4X4_100, 99),
-        'DICT_4X4_250': (cv2.aruco.DICT_4X4_250, 249),
-        'DICT_4X4_1000': (cv2.aruco.DICT_4X4_1000, 999),
-        'DICT_5X5_50': (cv2.aruco.DICT_5X5_50, 49),
-        'DICT_5X5_100': (cv2.aruco.DICT_5X5_100, 99),
-        'DICT_5X5_250': (cv2.aruco.DICT_5X5_250, 249),
-        'DICT_5X5_1000': (cv2.aruco.DICT_5X5_1000, 999),
-        'DICT_6X6_50': (cv2.aruco.DICT_6X6_50, 49),
-        'DICT_6X6_100': (cv2.aruco.DICT_6X6_100, 99),
-        'DICT_6X6_250': (cv2.aruco.DICT_6X6_250, 249),
-        'DICT_6X6_1000': (cv2.aruco.DICT_6X6_1000, 999),
-        'DICT_7X7_50': (cv2.aruco.DICT_7X7_50, 49),
-        'DICT_7X7_100': (cv2.aruco.DICT_7X7_100, 99),
-        'DICT_7X7_250': (cv2.aruco.DICT_7X7_250, 249),
-        'DICT_7X7_1000': (cv2.aruco.DICT_7X7_1000, 999),
-    }
+    _validate_marker_ids([marker_id], dictionary_name)
     
-    if dictionary_name not in aruco_dict_map:
-        raise ValueError(f"Invalid dictionary name. Choose from: {list(aruco_dict_map.keys())}")
-    
-    dict_constant, max_id = aruco_dict_map[dictionary_name]
-    
-    # Validate marker ID is within valid range for the dictionary
-    if marker_id < 0 or marker_id > max_id:
-        raise ValueError(f"Marker ID {marker_id} is out of range for {dictionary_name}. Valid range: 0-{max_id}")
-    
-    # Get the ArUco dictionary
-    aruco_dict = cv2.aruco.getPredefinedDictionary(dict_constant)
+    # Get the ArUco dictionary (cached across calls)
+    aruco_dict = _get_dict(dictionary_name)
     
     # Generate the marker
-    marker_image = cv2.aruco.generateImageMarker(aruco_dict, marker_id, size)
+    marker_image = _render_marker(aruco_dict, marker_id, size)
     
     # Save or display the marker
     if output_path:
-        cv2.imwrite(output_path, marker_image)
+        _write_marker(output_path, marker_image)
         print(f"ArUco marker {marker_id} saved to {output_path}")
     
     return marker_image
 
 
 def generate_multiple_markers(start_id, count, dictionary_name='DICT_4X4_50', 
-                              size=200, output_dir='aruco_markers'):
+                              size=200, output_dir='aruco_markers', pdf_path=None, dpi=300):
     """
     Generate multiple ArUco markers.
     
@@ -81,15 +138,46 @@ def generate_multiple_markers(start_id, count, dictionary_name='DICT_4X4_50',
         dictionary_name (str): The ArUco dictionary to use
         size (int): The size of each marker in pixels
         output_dir (str): Directory to save the markers
+        pdf_path (str): If given, save all markers to this multi-page PDF instead
+            of writing one PNG per marker to ``output_dir``
+        dpi (int): Print resolution for the PDF pages (default: 300)
     """
+    marker_ids = range(start_id, start_id + count)
+    
+    if pdf_path:
+        _validate_marker_ids(marker_ids, dictionary_name)
+        aruco_dict = _get_dict(dictionary_name)
+        
+        # Create the PDF's directory if it doesn't exist
+        pdf_dir = os.path.dirname(pdf_path)
+        if pdf_dir and not os.path.exists(pdf_dir):
+            os.makedirs(pdf_dir)
+        
+        # Render in parallel, then write every marker into a single file
+        with ThreadPoolExecutor() as executor:
+            marker_images = list(executor.map(
+                lambda marker_id: _render_marker(aruco_dict, marker_id, size), marker_ids))
+        save_markers_pdf(marker_images, pdf_path, dpi)
+        
+        print(f"Generated {count} markers in '{pdf_path}'")
+        return
+    
     # Create output directory if it doesn't exist
     if not os.path.exists(output_dir):
         os.makedirs(output_dir)
     
-    for i in range(count):
-        marker_id = start_id + i
+    def generate_one(marker_id):
         output_path = os.path.join(output_dir, f'aruco_marker_{marker_id}.png')
-        generate_aruco_marker(marker_id, dictionary_name, size, output_path)
+        marker_image = generate_aruco_marker(marker_id, dictionary_name, size, None)
+        _write_marker(output_path, marker_image)
+        return output_path
+    
+    # Markers are independent and OpenCV releases the GIL while generating and
+    # encoding, so fan the work out across a thread pool. Results come back in
+    # ID order, so progress is reported in order too.
+    with ThreadPoolExecutor() as executor:
+        for marker_id, output_path in zip(marker_ids, executor.map(generate_one, marker_ids)):
+            print(f"ArUco marker {marker_id} saved to {output_path}")
     
     print(f"\nGenerated {count} markers in '{output_dir}' directory")
 
@@ -109,6 +197,104 @@ def mm_to_pixels(mm, dpi=300):
     return int(inches * dpi)
 
 
+def _write_pdf(output_path, pages):
+    """
+    Write grayscale images to a PDF, one image per page.
+    
+    Each page is a ``(pixels, width, height, image_size, page_size)`` tuple:
+    8-bit grayscale pixel bytes, the pixel dimensions, and the image and page
+    (width, height) in PDF points (1/72 inch). The image is placed at the
+    top-left of its page. Pixels are embedded losslessly as Flate-compressed
+    image streams, so no PNG encoding is involved.
+    """
+    # Catalog and page tree come first; each page then takes three objects:
+    # the page itself, its image and its content stream
+    objects = [b"<< /Type /Catalog /Pages 2 0 R >>", None]
+    kids = []
+    for pixels, width, height, (image_width, image_height), (page_width, page_height) in pages:
+        page_number = len(objects) + 1
+        kids.append(b"%d 0 R" % page_number)
+        
+        image_data = zlib.compress(pixels, 1)
+        # PDF's origin is bottom-left, so lift the image to the top of the page
+        content = (f"q {image_width:.4f} 0 0 {image_height:.4f} 0 {page_height - image_height:.4f} cm "
+                   f"/Im0 Do Q").encode()
+        objects += [
+            (f"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 {page_width:.4f} {page_height:.4f}] "
+             f"/Resources << /XObject << /Im0 {page_number + 1} 0 R >> >> "
+             f"/Contents {page_number + 2} 0 R >>").encode(),
+            (f"<< /Type /XObject /Subtype /Image /Width {width} /Height {height} "
+             f"/ColorSpace /DeviceGray /BitsPerComponent 8 /Interpolate false "
+             f"/Filter /FlateDecode /Length {len(image_data)} >>\nstream\n").encode()
+            + image_data + b"\nendstream",
+            f"<< /Length {len(content)} >>\nstream\n".encode() + content + b"\nendstream",
+        ]
+    objects[1] = b"<< /Type /Pages /Kids [%s] /Count %d >>" % (b" ".join(kids), len(kids))
+    
+    # Write the objects, then the cross-reference table pointing at each one
+    pdf = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for number, obj in enumerate(objects, start=1):
+        offsets.append(len(pdf))
+        pdf += b"%d 0 obj\n" % number + obj + b"\nendobj\n"
+    
+    xref_offset = len(pdf)
+    pdf += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    for offset in offsets:
+        pdf += b"%010d 00000 n \n" % offset
+    pdf += b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (
+        len(objects) + 1, xref_offset)
+    
+    with open(output_path, 'wb') as f:
+        f.write(pdf)
+
+
+def save_layout_pdf(layout_image, output_path, dpi=300, page_size_mm=None):
+    """
+    Save a grayscale layout image as a single-page PDF at its physical size.
+    
+    Args:
+        layout_image (PIL.Image.Image): Layout image (stored as grayscale)
+        output_path (str): Path to save the PDF
+        dpi (int): Resolution the layout was rendered at (default: 300)
+        page_size_mm (tuple): Paper (width, height) in millimeters. If None, the
+            page is the size of the image at ``dpi``.
+    """
+    if layout_image.mode != 'L':
+        layout_image = layout_image.convert('L')
+    width, height = layout_image.size
+    
+    # Image size in PDF points (1/72 inch), so markers print at their true size
+    image_size = (width * 72 / dpi, height * 72 / dpi)
+    
+    # The pixel size is truncated to whole pixels, so take the page size from
+    # the paper itself when it is known
+    if page_size_mm:
+        page_size = (page_size_mm[0] * 72 / 25.4, page_size_mm[1] * 72 / 25.4)
+    else:
+        page_size = image_size
+    
+    _write_pdf(output_path, [(layout_image.tobytes(), width, height, image_size, page_size)])
+
+
+def save_markers_pdf(marker_images, output_path, dpi=300):
+    """
+    Save marker images as a multi-page PDF, one marker per page.
+    
+    Args:
+        marker_images (list): Grayscale marker images (numpy.ndarray)
+        output_path (str): Path to save the PDF
+        dpi (int): Print resolution; each page is the marker's size at this DPI
+            (default: 300)
+    """
+    pages = []
+    for marker_image in marker_images:
+        height, width = marker_image.shape[:2]
+        size = (width * 72 / dpi, height * 72 / dpi)
+        pages.append((marker_image.tobytes(), width, height, size, size))
+    _write_pdf(output_path, pages)
+
+
 def generate_print_layout(marker_ids, dictionary_name='DICT_4X4_50', 
                           format_type='a4', output_path='aruco_print_layout.png',
                           dpi=300, margin_mm=10):
@@ -119,10 +305,18 @@ def generate_print_layout(marker_ids, dictionary_name='DICT_4X4_50',
         marker_ids (list): List of marker IDs to include in the layout
         dictionary_name (str): The ArUco dictionary to use
         format_type (str): Paper format - 'creditcard', 'a4', or 'a5'
-        output_path (str): Path to save the layout image
+        output_path (str): Path to save the layout image. Paths ending in .pdf are
+            saved as a PDF on a page of the paper size, anything else as an image.
+            If None, the layout is only returned and nothing is written to disk.
         dpi (int): Resolution in dots per inch (default: 300 for print quality)
         margin_mm (float): Margin in millimeters (default: 10mm)
+    
+    Returns:
+        PIL.Image.Image: The generated layout image
     """
+    # PIL is only needed for layouts, so keep it off the single-marker path
+    from PIL import Image, ImageDraw, ImageFont
+    
     # Define paper dimensions in millimeters (width x height)
     format_sizes = {
         'creditcard': (85.60, 53.98),  # Standard credit card size
@@ -139,9 +333,9 @@ def generate_print_layout(marker_ids, dictionary_name='DICT_4X4_50',
     paper_height_px = mm_to_pixels(paper_height_mm, dpi)
     margin_px = mm_to_pixels(margin_mm, dpi)
     
-    # Create white background
-    layout_image = Image.new('RGB', (paper_width_px, paper_height_px), 'white')
-    draw = ImageDraw.Draw(layout_image)
+    # Create white grayscale background; markers are black and white, so a
+    # single channel holds the page at a third of the size of RGB
+    canvas = np.full((paper_height_px, paper_width_px), 255, dtype=np.uint8)
     
     # Calculate marker size and spacing based on format
     available_width = paper_width_px - (2 * margin_px)
@@ -149,88 +343,113 @@ def generate_print_layout(marker_ids, dictionary_name='DICT_4X4_50',
     
     num_markers = len(marker_ids)
     
+    # Space between markers
+    spacing_px = mm_to_pixels(10, dpi)
+    
     if format_type == 'creditcard':
         # For credit card, place one large marker centered
-        marker_size_px = min(available_width, available_height) - mm_to_pixels(10, dpi)
+        marker_size_px = min(available_width, available_height) - spacing_px
         cols, rows = 1, 1
     elif format_type == 'a5':
         # For A5, arrange in 2 columns
         cols = 2
         rows = (num_markers + cols - 1) // cols  # Ceiling division
         marker_size_px = min(
-            (available_width - mm_to_pixels(10, dpi) * (cols - 1)) // cols,
-            (available_height - mm_to_pixels(10, dpi) * (rows - 1)) // rows
+            (available_width - spacing_px * (cols - 1)) // cols,
+            (available_height - spacing_px * (rows - 1)) // rows
         )
     else:  # a4
         # For A4, arrange in 3 columns
         cols = 3
         rows = (num_markers + cols - 1) // cols  # Ceiling division
         marker_size_px = min(
-            (available_width - mm_to_pixels(10, dpi) * (cols - 1)) // cols,
-            (available_height - mm_to_pixels(10, dpi) * (rows - 1)) // rows
+            (available_width - spacing_px * (cols - 1)) // cols,
+            (available_height - spacing_px * (rows - 1)) // rows
         )
     
     # Limit marker size for readability
     marker_size_px = min(marker_size_px, mm_to_pixels(80, dpi))
     
-    spacing_px = mm_to_pixels(10, dpi)
+    if num_markers > rows * cols:
+        print(f"Warning: Not all markers fit on the page. Only showing first {rows * cols} markers.")
     
-    # Generate and place markers
-    for idx, marker_id in enumerate(marker_ids):
-        if idx >= rows * cols:
-            print(f"Warning: Not all markers fit on the page. Only showing first {rows * cols} markers.")
-            break
-        
-        # Generate marker
-        marker_img_cv = generate_aruco_marker(marker_id, dictionary_name, marker_size_px, None)
-        
-        # Convert from OpenCV (numpy array) to PIL Image
-        marker_img_pil = Image.fromarray(marker_img_cv)
-        
-        # Calculate position
-        col = idx % cols
-        row = idx // cols
-        
-        # Center the grid on the page
-        total_width = cols * marker_size_px + (cols - 1) * spacing_px
-        total_height = rows * marker_size_px + (rows - 1) * spacing_px
-        start_x = margin_px + (available_width - total_width) // 2
-        start_y = margin_px + (available_height - total_height) // 2
-        
-        x = start_x + col * (marker_size_px + spacing_px)
-        y = start_y + row * (marker_size_px + spacing_px)
-        
-        # Paste marker onto layout
-        layout_image.paste(marker_img_pil, (x, y))
-        
-        # Add marker ID label below the marker
-        font_size = max(12, marker_size_px // 20)
-        font = None
-        
-        # Try to load a TrueType font, fall back to default if not available
+    # Center the grid on the page
+    total_width = cols * marker_size_px + (cols - 1) * spacing_px
+    total_height = rows * marker_size_px + (rows - 1) * spacing_px
+    start_x = margin_px + (available_width - total_width) // 2
+    start_y = margin_px + (available_height - total_height) // 2
+    
+    # Distance from one marker's corner to the next
+    stride = marker_size_px + spacing_px
+    
+    # Validate all placed markers up front and resolve the dictionary once,
+    # so the loop only renders
+    placed_ids = marker_ids[:rows * cols]
+    _validate_marker_ids(placed_ids, dictionary_name)
+    aruco_dict = _get_dict(dictionary_name)
+    
+    def generate_one(marker_id):
+        return _render_marker(aruco_dict, marker_id, marker_size_px)
+    
+    # Generate markers concurrently (OpenCV releases the GIL) and place them
+    # straight into the page, in order, as they come back
+    marker_positions = []
+    with ThreadPoolExecutor() as executor:
+        marker_images = executor.map(generate_one, placed_ids)
+        for idx, (marker_id, marker_img_cv) in enumerate(zip(placed_ids, marker_images)):
+            # Calculate position
+            row, col = divmod(idx, cols)
+            x = start_x + col * stride
+            y = start_y + row * stride
+            
+            # Place marker onto layout
+            canvas[y:y + marker_size_px, x:x + marker_size_px] = marker_img_cv
+            marker_positions.append((marker_id, x, y))
+    
+    # Add light gray border for crop marks. The edges are inclusive, and
+    # slices (rather than indices) clip an edge that falls off the page.
+    border = margin_px // 2
+    right = paper_width_px - border
+    bottom = paper_height_px - border
+    canvas[border:border + 1, border:right + 1] = 211
+    canvas[bottom:bottom + 1, border:right + 1] = 211
+    canvas[border:bottom + 1, border:border + 1] = 211
+    canvas[border:bottom + 1, right:right + 1] = 211
+    
+    # Labels are drawn with PIL over the composed page
+    layout_image = Image.fromarray(canvas)
+    draw = ImageDraw.Draw(layout_image)
+    
+    # Load the label font once for all markers
+    font_size = max(12, marker_size_px // 20)
+    font = None
+    
+    # Try to load a TrueType font, fall back to default if not available
+    try:
+        # Common font paths for different systems
+        font_paths = [
+            "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf",  # Linux
+            "/System/Library/Fonts/Helvetica.ttc",  # macOS
+            "C:\\Windows\\Fonts\\arial.ttf",  # Windows
+        ]
+        for font_path in font_paths:
+            try:
+                font = ImageFont.truetype(font_path, font_size)
+                break
+            except (OSError, IOError):
+                continue
+    except Exception:
+        pass
+    
+    # Fall back to default font if TrueType font not found
+    if font is None:
         try:
-            # Common font paths for different systems
-            font_paths = [
-                "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf",  # Linux
-                "/System/Library/Fonts/Helvetica.ttc",  # macOS
-                "C:\\Windows\\Fonts\\arial.ttf",  # Windows
-            ]
-            for font_path in font_paths:
-                try:
-                    font = ImageFont.truetype(font_path, font_size)
-                    break
-                except (OSError, IOError):
-                    continue
+            font = ImageFont.load_default()
         except Exception:
-            pass
-        
-        # Fall back to default font if TrueType font not found
-        if font is None:
-            try:
-                font = ImageFont.load_default()
-            except Exception:
-                font = None
-        
+            font = None
+    
+    # Add marker ID labels below the markers
+    for marker_id, x, y in marker_positions:
         label_text = f"ID: {marker_id}"
         
         # Get text bounding box for centering
@@ -243,19 +462,17 @@ def generate_print_layout(marker_ids, dictionary_name='DICT_4X4_50',
         label_x = x + (marker_size_px - text_width) // 2
         label_y = y + marker_size_px + 5
         
-        draw.text((label_x, label_y), label_text, fill='black', font=font)
-    
-    # Add border for crop marks
-    draw.rectangle(
-        [(margin_px // 2, margin_px // 2), 
-         (paper_width_px - margin_px // 2, paper_height_px - margin_px // 2)],
-        outline='lightgray',
-        width=1
-    )
+        draw.text((label_x, label_y), label_text, fill=0, font=font)
     
     # Save the layout
-    layout_image.save(output_path, dpi=(dpi, dpi))
-    print(f"\nPrint layout saved to {output_path}")
+    if output_path:
+        if output_path.lower().endswith('.pdf'):
+            save_layout_pdf(layout_image, output_path, dpi,
+                            page_size_mm=(paper_width_mm, paper_height_mm))
+        else:
+            # Fast zlib level: the page is mostly flat white, so files stay small
+            layout_image.save(output_path, dpi=(dpi, dpi), compress_level=1, optimize=False)
+        print(f"\nPrint layout saved to {output_path}")
     print(f"Format: {format_type.upper()}, DPI: {dpi}, Paper size: {paper_width_mm}mm x {paper_height_mm}mm")
     print(f"Number of markers: {min(num_markers, rows * cols)}")
     
@@ -288,16 +505,19 @@ Examples:
   
   # Generate print layout for A5 paper with markers 10-13
   python generate_aruco.py --print-layout a5 --id 10 --count 4
+  
+  # Generate A4 print layout as a PDF
+  python generate_aruco.py --print-layout a4 --id 0 --pdf
+  
+  # Generate 10 markers into a single PDF, one marker per page
+  python generate_aruco.py --multiple 10 --pdf
         """
     )
     
     parser.add_argument('--id', type=int, default=0,
                        help='Marker ID to generate (default: 0)')
     parser.add_argument('--dict', type=str, default='DICT_4X4_50',
-                       choices=['DICT_4X4_50', 'DICT_4X4_100', 'DICT_4X4_250', 'DICT_4X4_1000',
-                               'DICT_5X5_50', 'DICT_5X5_100', 'DICT_5X5_250', 'DICT_5X5_1000',
-                               'DICT_6X6_50', 'DICT_6X6_100', 'DICT_6X6_250', 'DICT_6X6_1000',
-                               'DICT_7X7_50', 'DICT_7X7_100', 'DICT_7X7_250', 'DICT_7X7_1000'],
+                       choices=DICT_NAMES,
                        help='ArUco dictionary to use (default: DICT_4X4_50)')
     parser.add_argument('--size', type=int, default=200,
                        help='Marker size in pixels (default: 200)')
@@ -315,12 +535,23 @@ Examples:
     parser.add_argument('--count', type=int,
                        help='Number of markers to include in print layout (default: auto based on format)')
     parser.add_argument('--dpi', type=int, default=300,
-                       help='DPI resolution for print layout (default: 300)')
+                       help='DPI resolution for print layout or multi-marker PDF (default: 300)')
     parser.add_argument('--margin', type=float, default=10,
                        help='Margin in millimeters for print layout (default: 10mm)')
+    parser.add_argument('--pdf', action='store_true',
+                       help='Save the print layout as a PDF on a page of the paper size '
+                            '(default output: aruco_print_<format>.pdf), or save --multiple '
+                            'markers to one PDF, one marker per page at --dpi '
+                            '(default output: <output-dir>/aruco_markers.pdf)')
     
     args = parser.parse_args()
     
+    if args.pdf:
+        if not (args.print_layout or args.multiple):
+            parser.error('--pdf requires --print-layout or --multiple')
+        if args.output and not args.output.lower().endswith('.pdf'):
+            parser.error('--output must end in .pdf when --pdf is given')
+    
     if args.print_layout:
         # Generate print layout
         if args.count is None:
@@ -333,7 +564,8 @@ Examples:
             args.count = format_defaults.get(args.print_layout, 1)
         
         marker_ids = list(range(args.id, args.id + args.count))
-        output_path = args.output or f'aruco_print_{args.print_layout}.png'
+        extension = 'pdf' if args.pdf else 'png'
+        output_path = args.output or f'aruco_print_{args.print_layout}.{extension}'
         
         generate_print_layout(
             marker_ids=marker_ids,
@@ -345,12 +577,18 @@ Examples:
         )
     elif args.multiple:
         # Generate multiple markers
+        pdf_path = None
+        if args.pdf:
+            pdf_path = args.output or os.path.join(args.output_dir, 'aruco_markers.pdf')
+        
         generate_multiple_markers(
             start_id=args.id,
             count=args.multiple,
             dictionary_name=args.dict,
             size=args.size,
-            output_dir=args.output_dir
+            output_dir=args.output_dir,
+            pdf_path=pdf_path,
+            dpi=args.dpi
         )
     else:
         # Generate a single marker